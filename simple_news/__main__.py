@@ -45,6 +45,7 @@ def main():
     
     args = parser.parse_args()
     
+    storage = None
     try:
         # 加载配置
         print(f"\n{'='*60}")
@@ -66,7 +67,10 @@ def main():
         # 初始化模块
         crawler = NewsCrawler(config)
         storage = NewsStorage(config)
-        analyzer = KeywordAnalyzer(keywords)
+        analyzer = KeywordAnalyzer(
+            keywords,
+            ignore_case=config['report'].get('keyword_ignore_case', False),
+        )
         # 确定报告目录
         if config.get('report', {}).get('dir'):
             report_dir = Path(config['report']['dir'])
@@ -92,17 +96,14 @@ def main():
         news_list = storage.get_today_news(mode)
         print(f"✓ 获取了 {len(news_list)} 条新闻用于分析")
         
-        # 关键词分析
-        keyword_news = analyzer.analyze(news_list)
-        keyword_stats = analyzer.get_stats(keyword_news)
+        # 关键词分析（一次遍历同时得到统计和展示数据）
+        max_per_keyword = config['report'].get('max_news_per_keyword', 0)
+        weights = config.get('weight')  # 获取权重配置
+        keyword_stats, keyword_data = analyzer.analyze_and_format(news_list, max_per_keyword, weights)
         
         # 保存关键词统计
         storage.save_keyword_stats(keyword_stats)
         
-        max_per_keyword = config['report'].get('max_news_per_keyword', 0)
-        weights = config.get('weight')  # 获取权重配置
-        keyword_data = analyzer.format_for_display(keyword_news, max_per_keyword, weights)
-        
         print(f"✓ 匹配到 {len(keyword_data)} 个词组")
         
         # 生成 HTML 报告
@@ -118,6 +119,10 @@ def main():
         pushed_titles = []
         pushed_titles_set = set()
         filtered_keyword_data = []
+        # 一次查询出今天已推送过的标题
+        already_pushed = storage.already_pushed(
+            [news['title'] for group in keyword_data for news in group['news_list']]
+        )
         
         for group in keyword_data:
             new_news_list = []
@@ -127,7 +132,7 @@ def main():
                 if title in pushed_titles_set:
                     continue
 
-                if not storage.is_pushed(title):
+                if title not in already_pushed:
                     new_news_list.append(news)
                     pushed_titles.append(title)
                     pushed_titles_set.add(title)
@@ -177,6 +182,9 @@ def main():
         import traceback
         traceback.print_exc()
         return 1
+    finally:
+        if storage is not None:
+            storage.close()
 
 
 if __name__ == '__main__':
@@ -4,7 +4,10 @@
 支持关键词分组统计
 """
 
-from typing import Dict, List
+import heapq
+from typing import Dict, List, Optional, Tuple
+
+import ahocorasick
 
 
 class KeywordGroup:
@@ -20,6 +23,9 @@ class KeywordGroup:
         """
         self.name = name
         self.keywords = keywords
+        
+        # 忽略大小写匹配时使用的关键词，只在创建时计算一次
+        self.keywords_cf = [kw.casefold() for kw in keywords]
     
     def matches(self, title: str) -> bool:
         """
@@ -37,14 +43,65 @@ class KeywordGroup:
 class KeywordAnalyzer:
     """关键词分析器"""
 
-    def __init__(self, keyword_groups: List[KeywordGroup]):
+    def __init__(
+        self,
+        keyword_groups: List[KeywordGroup],
+        ignore_case: bool = False
+    ):
         """
         初始化分析器
         
         Args:
             keyword_groups: 关键词组列表
+            ignore_case: 是否忽略大小写匹配关键词
         """
         self.keyword_groups = keyword_groups
+        self.ignore_case = ignore_case
+        # 组名 -> 组对象（同名时保留第一个）
+        self._groups_by_name = {}
+        for group in keyword_groups:
+            self._groups_by_name.setdefault(group.name, group)
+        self._automaton = self._build_automaton(keyword_groups, ignore_case)
+        # 所有关键词的首字符集合：标题不含其中任何字符时必然不会命中，可直接跳过
+        self._first_chars = frozenset(
+            kw[0]
+            for group in keyword_groups
+            for kw in (group.keywords_cf if ignore_case else group.keywords)
+            if kw
+        )
+
+    @staticmethod
+    def _build_automaton(
+        keyword_groups: List[KeywordGroup],
+        ignore_case: bool = False
+    ) -> Optional[ahocorasick.Automaton]:
+        """
+        将所有组的关键词构建为一个 Aho-Corasick 自动机
+        
+        同一关键词可能属于多个组，因此每个关键词对应一个组索引元组
+        
+        Args:
+            keyword_groups: 关键词组列表
+            ignore_case: 是否使用 casefold 后的关键词
+            
+        Returns:
+            自动机对象，无关键词时返回 None
+        """
+        keyword_to_groups = {}
+        for index, group in enumerate(keyword_groups):
+            keywords = group.keywords_cf if ignore_case else group.keywords
+            for kw in keywords:
+                if kw:
+                    keyword_to_groups.setdefault(kw, []).append(index)
+        
+        if not keyword_to_groups:
+            return None
+        
+        automaton = ahocorasick.Automaton()
+        for kw, indexes in keyword_to_groups.items():
+            automaton.add_word(kw, tuple(indexes))
+        automaton.make_automaton()
+        return automaton
 
     def analyze(self, news_list: List[Dict]) -> Dict[str, List[Dict]]:
         """
@@ -56,26 +113,90 @@ class KeywordAnalyzer:
         Returns:
             {组名: [匹配的新闻列表]} 字典
         """
+        # 只保留有匹配的组（保持组的配置顺序）
         group_news = {}
-        
-        for group in self.keyword_groups:
-            matched_news = []
-            seen_titles = set()  # 去重：同一新闻在同组内只计一次
-            
-            for news in news_list:
-                title = news.get('title', '')
-                
-                # 检查是否匹配且未重复
-                if group.matches(title) and title not in seen_titles:
-                    matched_news.append(news)
-                    seen_titles.add(title)
-            
-            # 只保留有匹配的组
+        for group, matched_news in zip(self.keyword_groups, self._match_groups(news_list)):
             if matched_news:
                 group_news[group.name] = matched_news
         
         return group_news
 
+    def analyze_and_format(
+        self,
+        news_list: List[Dict],
+        max_per_group: int = 0,
+        weights: Dict[str, float] = None
+    ) -> Tuple[Dict[str, int], List[Dict]]:
+        """
+        一次遍历完成分析、统计和展示格式化
+        
+        等价于依次调用 analyze、get_stats 和 format_for_display，
+        但每个组只处理一次
+        
+        Args:
+            news_list: 新闻列表，每个元素包含 title 等字段
+            max_per_group: 每个组最多显示的新闻数（0=不限制）
+            weights: 排序权重配置 {'rank': 0.6, 'frequency': 0.3, 'hotness': 0.1}
+            
+        Returns:
+            ({组名: 出现次数} 字典, 按匹配数量降序排列的展示列表)
+        """
+        stats = {}
+        result = []
+        
+        for group_name, matched_news in self.analyze(news_list).items():
+            stats[group_name] = len(matched_news)
+            result.append(self._format_group(group_name, matched_news, max_per_group, weights))
+        
+        # 按匹配数量降序排列
+        result.sort(key=lambda x: x['count'], reverse=True)
+        
+        return stats, result
+
+    def _match_groups(self, news_list: List[Dict]) -> List[List[Dict]]:
+        """
+        扫描新闻标题，按组收集命中的新闻
+        
+        Args:
+            news_list: 新闻列表，每个元素包含 title 等字段
+            
+        Returns:
+            与 keyword_groups 一一对应的命中新闻列表
+        """
+        matched_lists = [[] for _ in self.keyword_groups]
+        if self._automaton is None:
+            return matched_lists
+        
+        # 先按标题全局去重：同一标题出现在多个平台时保留排名最高的一条，
+        # 位置沿用该标题首次出现的位置
+        unique_news = {}
+        for news in news_list:
+            title = news['title']
+            if not title:
+                continue
+            
+            kept = unique_news.get(title)
+            if kept is None or news.get('rank', 999) < kept.get('rank', 999):
+                unique_news[title] = news
+        
+        # 每个不同标题只扫描一次，得到其命中的所有组
+        for title, news in unique_news.items():
+            # 忽略大小写时每个标题只 casefold 一次
+            text = title.casefold() if self.ignore_case else title
+            if self._first_chars.isdisjoint(text):
+                continue
+            
+            matched_groups = {
+                index
+                for _, indexes in self._automaton.iter(text)
+                for index in indexes
+            }
+            
+            for index in matched_groups:
+                matched_lists[index].append(news)
+        
+        return matched_lists
+
     def get_stats(self, group_news: Dict[str, List[Dict]]) -> Dict[str, int]:
         """
         获取关键词组统计
@@ -105,37 +226,59 @@ class KeywordAnalyzer:
         Returns:
             格式化后的列表，按匹配数量降序排列
         """
-        result = []
-        
-        for group_name, news_list in group_news.items():
-            # 如果启用了权重排序，重新排序新闻列表
-            if weights:
-                news_list = self._sort_by_weight(news_list, weights)
-            
-            # 限制条数
-            if max_per_group > 0:
-                news_list = news_list[:max_per_group]
-            
-            # 查找对应的 KeywordGroup 对象
-            group_obj = next((g for g in self.keyword_groups if g.name == group_name), None)
-            keywords = group_obj.keywords if group_obj else []
-            
-            result.append({
-                'group_name': group_name,      # 组名（显示）
-                'keywords': keywords,          # 组内关键词列表
-                'count': len(news_list),       # 匹配数量
-                'news_list': news_list,        # 新闻列表
-            })
+        result = [
+            self._format_group(group_name, news_list, max_per_group, weights)
+            for group_name, news_list in group_news.items()
+        ]
         
         # 按匹配数量降序排列
         result.sort(key=lambda x: x['count'], reverse=True)
         
         return result
     
+    def _format_group(
+        self,
+        group_name: str,
+        news_list: List[Dict],
+        max_per_group: int = 0,
+        weights: Dict[str, float] = None
+    ) -> Dict:
+        """
+        格式化单个组的展示数据
+        
+        Args:
+            group_name: 组名
+            news_list: 该组命中的新闻列表
+            max_per_group: 每个组最多显示的新闻数（0=不限制）
+            weights: 排序权重配置
+            
+        Returns:
+            组展示数据字典
+        """
+        # 如果启用了权重排序，重新排序新闻列表
+        if weights:
+            news_list = self._sort_by_weight(news_list, weights, max_per_group)
+        
+        # 限制条数
+        if max_per_group > 0:
+            news_list = news_list[:max_per_group]
+        
+        # 查找对应的 KeywordGroup 对象
+        group_obj = self._groups_by_name.get(group_name)
+        keywords = group_obj.keywords if group_obj else []
+        
+        return {
+            'group_name': group_name,      # 组名（显示）
+            'keywords': keywords,          # 组内关键词列表
+            'count': len(news_list),       # 匹配数量
+            'news_list': news_list,        # 新闻列表
+        }
+    
     def _sort_by_weight(
         self, 
         news_list: List[Dict], 
-        weights: Dict[str, float]
+        weights: Dict[str, float],
+        limit: int = 0
     ) -> List[Dict]:
         """
         根据权重重新排序新闻
@@ -143,16 +286,39 @@ class KeywordAnalyzer:
         Args:
             news_list: 新闻列表
             weights: 权重配置 {'rank': 0.6, 'frequency': 0.3, 'hotness': 0.1}
+            limit: 只需要前多少条（0=全部）
             
         Returns:
-            排序后的新闻列表
+            排序后的新闻列表（limit 较小时只包含前 limit 条）
+        """
+        # 综合分数只在排序键中计算一次，不再写回每条新闻
+        weight_key = self._make_weight_key(weights)
+        
+        # 只取少量头部时用堆选出前 limit 条，避免整表排序（结果与排序后切片一致）
+        if 0 < limit < len(news_list) // 4:
+            return heapq.nlargest(limit, news_list, key=weight_key)
+        
+        news_list.sort(key=weight_key, reverse=True)
+        
+        return news_list
+
+    @staticmethod
+    def _make_weight_key(weights: Dict[str, float]):
+        """
+        生成计算新闻综合分数的排序键函数
+        
+        Args:
+            weights: 权重配置 {'rank': 0.6, 'frequency': 0.3, 'hotness': 0.1}
+            
+        Returns:
+            接收新闻字典、返回综合分数的函数
         """
         rank_weight = weights.get('rank', 0.6)
-        frequency_weight = weights.get('frequency', 0.3)
         hotness_weight = weights.get('hotness', 0.1)
+        # 频次权重（weights['frequency']）暂不参与计算，因为单条新闻没有频次概念
+        # 如果需要可以统计该新闻在多个平台出现的次数
         
-        # 计算每条新闻的综合分数
-        for news in news_list:
+        def weight_score(news: Dict) -> float:
             rank = news.get('rank', 999)  # 排名，越小越好
             # 将排名转换为分数（排名1 = 100分，排名100 = 1分）
             rank_score = max(0, 101 - rank)
@@ -161,18 +327,6 @@ class KeywordAnalyzer:
             hotness = news.get('hotness', 0)
             hotness_score = hotness / 1000 if hotness else 0  # 归一化
             
-            # 频次分数（暂时设为0，因为单条新闻没有频次概念）
-            # 如果需要可以统计该新闻在多个平台出现的次数
-            frequency_score = 0
-            
-            # 综合分数
-            news['weight_score'] = (
-                rank_score * rank_weight +
-                frequency_score * frequency_weight +
-                hotness_score * hotness_weight
-            )
+            return rank_score * rank_weight + hotness_score * hotness_weight
         
-        # 按综合分数降序排序
-        news_list.sort(key=lambda x: x.get('weight_score', 0), reverse=True)
-        
-        return news_list
+        return weight_score
@@ -5,11 +5,19 @@
 """
 
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any, List, Tuple
+from zoneinfo import ZoneInfo
 import yaml
 from dotenv import load_dotenv
 
+# 优先使用 libyaml 的 C 实现，未编译 libyaml 时回退到纯 Python 版本
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
 
 def get_project_root() -> Path:
     """获取项目根目录"""
@@ -19,6 +27,20 @@ def get_project_root() -> Path:
     return current_file.parent.parent
 
 
+@lru_cache(maxsize=None)
+def get_timezone(name: str) -> ZoneInfo:
+    """
+    获取时区对象（按名称缓存，整个进程内复用）
+    
+    Args:
+        name: 时区名称，如 Asia/Shanghai
+        
+    Returns:
+        时区对象
+    """
+    return ZoneInfo(name)
+
+
 def load_config(config_path: str = None) -> Dict[str, Any]:
     """
     加载配置文件
@@ -42,7 +64,7 @@ def load_config(config_path: str = None) -> Dict[str, Any]:
         raise FileNotFoundError(f"配置文件不存在: {config_path}")
     
     with open(config_path, 'r', encoding='utf-8') as f:
-        config = yaml.safe_load(f)
+        config = yaml.load(f, Loader=SafeLoader)
     
     # 2. 环境变量覆盖配置
     _override_from_env(config)
@@ -160,41 +182,43 @@ def load_keywords(keywords_path: str = None):
     current_keywords = []
     
     with open(keywords_path, 'r', encoding='utf-8') as f:
-        for line in f:
-            line = line.strip()
-            
-            # 跳过注释
-            if line.startswith('#'):
-                continue
-            
-            # 空行表示分组结束
-            if not line:
-                if current_keywords:
-                    # 保存当前组
-                    name = current_group_name or ' / '.join(current_keywords)
-                    groups.append(KeywordGroup(name, current_keywords))
-                    current_group_name = None
-                    current_keywords = []
-                continue
-            
-            # 组名：[组名]
-            if line.startswith('[') and line.endswith(']'):
-                # 先保存前一个组（如果有）
-                if current_keywords:
-                    name = current_group_name or ' / '.join(current_keywords)
-                    groups.append(KeywordGroup(name, current_keywords))
-                
-                # 开始新组
-                current_group_name = line[1:-1]
+        content = f.read()
+    
+    for line in content.splitlines():
+        line = line.strip()
+        
+        # 跳过注释
+        if line.startswith('#'):
+            continue
+        
+        # 空行表示分组结束
+        if not line:
+            if current_keywords:
+                # 保存当前组
+                name = current_group_name or ' / '.join(current_keywords)
+                groups.append(KeywordGroup(name, current_keywords))
+                current_group_name = None
                 current_keywords = []
-            else:
-                # 普通关键词
-                current_keywords.append(line)
+            continue
         
-        # 保存最后一个组
-        if current_keywords:
-            name = current_group_name or ' / '.join(current_keywords)
-            groups.append(KeywordGroup(name, current_keywords))
+        # 组名：[组名]
+        if line.startswith('[') and line.endswith(']'):
+            # 先保存前一个组（如果有）
+            if current_keywords:
+                name = current_group_name or ' / '.join(current_keywords)
+                groups.append(KeywordGroup(name, current_keywords))
+            
+            # 开始新组
+            current_group_name = line[1:-1]
+            current_keywords = []
+        else:
+            # 普通关键词
+            current_keywords.append(line)
+    
+    # 保存最后一个组
+    if current_keywords:
+        name = current_group_name or ' / '.join(current_keywords)
+        groups.append(KeywordGroup(name, current_keywords))
     
     return groups
 
@@ -7,10 +7,47 @@
 
 import json
 import random
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Tuple, Optional, Union
 
 import requests
+from requests.adapters import HTTPAdapter
+
+
+class RateLimiter:
+    """令牌桶限速器（线程安全），限制对同一主机发起请求的速率"""
+
+    def __init__(self, rate: float, capacity: int):
+        """
+        初始化限速器
+        
+        Args:
+            rate: 每秒补充的令牌数，<= 0 表示不限速
+            capacity: 令牌桶容量（允许的突发请求数）
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """取得一个令牌，令牌不足时阻塞当前线程直到轮到自己"""
+        if self.rate <= 0:
+            return
+        
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            # 先预约令牌（可以为负），再在锁外等待，保证先到先得
+            self._tokens -= 1
+            wait_time = -self._tokens / self.rate if self._tokens < 0 else 0
+        
+        if wait_time > 0:
+            time.sleep(wait_time)
 
 
 class NewsCrawler:
@@ -39,9 +76,24 @@ class NewsCrawler:
         crawler_config = config['crawler']
         
         self.request_interval = crawler_config['request_interval']
+        self.concurrency = max(1, crawler_config.get('concurrency', 4))
         self.use_proxy = crawler_config['use_proxy']
         self.proxy_url = crawler_config.get('proxy', '') if self.use_proxy else None
 
+        # 复用同一主机的 TCP/TLS 连接，连接池大小与并发数一致
+        self.session = requests.Session()
+        self.session.headers.update(self.HEADERS)
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.concurrency, max_retries=0)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+        # 所有平台共用同一个 API 主机：每个请求（含重试）都从同一令牌桶取令牌，
+        # 仍保持每 request_interval 最多一个请求、不允许突发，并发只用来重叠等待响应的时间
+        self.rate_limiter = RateLimiter(
+            rate=1000 / self.request_interval if self.request_interval > 0 else 0,
+            capacity=1,
+        )
+
     def fetch_platform(self, platform_id: str, platform_name: str) -> Optional[Dict]:
         """
         获取单个平台的数据
@@ -62,15 +114,16 @@ class NewsCrawler:
         max_retries = 2
         for retry in range(max_retries + 1):
             try:
-                response = requests.get(
+                self.rate_limiter.acquire()
+                response = self.session.get(
                     url,
                     proxies=proxies,
-                    headers=self.HEADERS,
                     timeout=10,
                 )
                 response.raise_for_status()
                 
-                data = response.json()
+                # 直接解析原始字节，跳过 requests 的编码探测和解码
+                data = json.loads(response.content)
                 status = data.get('status', '未知')
                 
                 if status not in ['success', 'cache']:
@@ -105,13 +158,14 @@ class NewsCrawler:
         news_list = []
         
         for index, item in enumerate(data.get('items', []), 1):
+            # 只接受非空字符串标题，规范化结果直接存入新闻字典
             title = item.get('title')
+            title = title.strip() if isinstance(title, str) else None
             
             # 跳过无效标题
-            if not title or isinstance(title, (float, int)) or not str(title).strip():
+            if not title:
                 continue
             
-            title = str(title).strip()
             news_list.append({
                 'title': title,
                 'url': item.get('url', ''),
@@ -138,18 +192,14 @@ class NewsCrawler:
         print(f"\n开始爬取 {len(platforms)} 个平台...")
         print("=" * 50)
         
-        results = []
-        
-        for i, (platform_id, platform_name) in enumerate(platforms):
-            data = self.fetch_platform(platform_id, platform_name)
-            if data:
-                results.append(data)
-            
-            # 请求间隔（最后一个不需要等待）
-            if i < len(platforms) - 1:
-                interval = self.request_interval + random.randint(-100, 200)
-                interval = max(100, interval)  # 至少 100ms
-                time.sleep(interval / 1000)
+        # 多个平台并发请求，按配置顺序收集结果
+        max_workers = max(1, min(self.concurrency, len(platforms)))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(self.fetch_platform, platform_id, platform_name)
+                for platform_id, platform_name in platforms
+            ]
+            results = [data for data in (future.result() for future in futures) if data]
         
         print("=" * 50)
         print(f"爬取完成: 成功 {len(results)}/{len(platforms)} 个平台\n")
@@ -9,7 +9,7 @@ import os
 import time
 import requests
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from pathlib import Path
 
 
@@ -113,7 +113,12 @@ class Notifier:
         
         return success
     
-    def _split_into_batches(self, stats: Dict, keyword_data: List[Dict], html_report_path: Optional[str]) -> List[str]:
+    def _split_into_batches(
+        self,
+        stats: Dict,
+        keyword_data: List[Dict],
+        html_report_path: Optional[str]
+    ) -> List[Tuple[str, int]]:
         """将通知内容分割成多个批次
         
         Args:
@@ -122,78 +127,121 @@ class Notifier:
             html_report_path: HTML 报告路径
         
         Returns:
-            批次列表
+            (批次内容, 批次字节数) 列表
         """
         batches = []
-        now = datetime.now()
+        # 只格式化一次时间，头部使用精确到分钟的前缀
+        updated_at = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
         
         # 构建头部（每个批次都包含）
         base_header = f"""**总新闻数：** {stats.get('today_news', 0)}条
-**时间：** {now.strftime('%Y-%m-%d %H:%M')}
+**时间：** {updated_at[:16]}
 
 ---
 
 """
         
         # 构建底部（每个批次都包含）
-        base_footer = f"\n\n> 更新时间：{now.strftime('%Y-%m-%d %H:%M:%S')}"
+        base_footer = f"\n\n> 更新时间：{updated_at}"
 
         
         if not keyword_data:
             content = base_header + "暂无匹配的关键词\n" + base_footer
-            batches.append(content)
+            batches.append((content, len(content.encode('utf-8'))))
             return batches
         
-        # 当前批次内容
-        current_batch = base_header
+        # 头部/底部字节数只计算一次，批次大小增量累加
+        header_size = len(base_header.encode('utf-8'))
+        footer_size = len(base_footer.encode('utf-8'))
+        
+        # 当前批次内容（片段列表，落批时再拼接）
+        current_parts = [base_header]
+        current_size = header_size
         current_batch_has_content = False
         
-        # 内容限制（防止单条新闻过长）
-
+        # 单个关键词块（含批次头尾）能容纳的最大字节数
+        max_block_size = self.max_batch_size - header_size - footer_size
         
         # 处理所有关键词（不限制数量，通过分批次解决）
         total_keywords = len(keyword_data)
         for i, kw in enumerate(keyword_data, 1):
-            group_name = kw['group_name']  # 使用组名
-            news_list = kw['news_list']
-            
-            # 关键词标题（仅保留组名）
-            keyword_header = f"**{group_name}**\n\n"
-            
-            # 处理新闻列表
-            news_content = ""
-            for j, news in enumerate(news_list, 1):
-                formatted_news = self._format_news_item(news, j)
-                news_content += formatted_news
-            
-            # 关键词完整内容
-            keyword_full_content = keyword_header + news_content
-            
             # 关键词间分隔符
-            if i < total_keywords:
-                keyword_full_content += "---\n\n"
+            separator = "---\n\n" if i < total_keywords else ""
             
-            # 检查是否需要分批
-            test_content = current_batch + keyword_full_content
-            content_size = len(test_content.encode('utf-8')) + len(base_footer.encode('utf-8'))
+            # 超过单批容量的关键词会按新闻拆成多个块
+            blocks = self._build_keyword_blocks(
+                kw['group_name'], kw['news_list'], separator, max_block_size
+            )
             
-            if content_size >= self.max_batch_size:
-                # 当前批次已满，保存并开启新批次
-                if current_batch_has_content:
-                    batches.append(current_batch + base_footer)
-                current_batch = base_header + keyword_full_content
-                current_batch_has_content = True
-            else:
-                # 添加到当前批次
-                current_batch = test_content
+            for block_content, block_size in blocks:
+                # 检查是否需要分批
+                if current_size + block_size + footer_size >= self.max_batch_size:
+                    # 当前批次已满，保存并开启新批次
+                    if current_batch_has_content:
+                        batches.append((''.join(current_parts) + base_footer, current_size + footer_size))
+                    current_parts = [base_header, block_content]
+                    current_size = header_size + block_size
+                else:
+                    # 添加到当前批次
+                    current_parts.append(block_content)
+                    current_size += block_size
                 current_batch_has_content = True
         
         # 保存最后一个批次
         if current_batch_has_content:
-            batches.append(current_batch + base_footer)
+            batches.append((''.join(current_parts) + base_footer, current_size + footer_size))
         
         return batches
     
+    def _build_keyword_blocks(
+        self,
+        group_name: str,
+        news_list: List[Dict],
+        separator: str,
+        max_block_size: int
+    ) -> List[Tuple[str, int]]:
+        """生成单个关键词的推送内容块
+        
+        整组放得进一个批次时返回一个块；否则按新闻拆成多个块，
+        每块都重复组名标题，序号连续，分隔符只放在最后一块
+        
+        Args:
+            group_name: 组名
+            news_list: 新闻列表
+            separator: 关键词间分隔符（最后一个关键词为空）
+            max_block_size: 单个块允许的最大字节数
+        
+        Returns:
+            (块内容, 块字节数) 列表
+        """
+        # 关键词标题（仅保留组名）
+        keyword_header = f"**{group_name}**\n\n"
+        keyword_header_size = len(keyword_header.encode('utf-8'))
+        separator_size = len(separator.encode('utf-8'))
+        
+        items = [self._format_news_item(news, j) for j, news in enumerate(news_list, 1)]
+        item_sizes = [len(item.encode('utf-8')) for item in items]
+        
+        total_size = keyword_header_size + sum(item_sizes) + separator_size
+        if total_size < max_block_size:
+            return [(keyword_header + ''.join(items) + separator, total_size)]
+        
+        blocks = []
+        parts = [keyword_header]
+        size = keyword_header_size
+        for item, item_size in zip(items, item_sizes):
+            # 至少放一条新闻，单条过长时只能单独成块
+            if len(parts) > 1 and size + item_size + separator_size >= max_block_size:
+                blocks.append((''.join(parts), size))
+                parts = [keyword_header]
+                size = keyword_header_size
+            parts.append(item)
+            size += item_size
+        
+        parts.append(separator)
+        blocks.append((''.join(parts), size + separator_size))
+        return blocks
+    
     def _format_news_item(self, news: Dict, index: int) -> str:
         """格式化单条新闻（带 Markdown 链接）
         
@@ -227,11 +275,11 @@ class Notifier:
         
         return result
     
-    def _send_batches(self, batches: List[str]) -> bool:
+    def _send_batches(self, batches: List[Tuple[str, int]]) -> bool:
         """批次发送（反向顺序）
         
         Args:
-            batches: 批次列表
+            batches: (批次内容, 批次字节数) 列表
         
         Returns:
             是否全部成功
@@ -248,11 +296,10 @@ class Notifier:
             print(f"将按反向顺序推送 {total_batches} 个批次（最后批次先推送）")
         
         success_count = 0
-        for idx, batch_content in enumerate(reversed_batches, 1):
+        for idx, (batch_content, content_size) in enumerate(reversed_batches, 1):
             # 计算用户视角的批次编号
             actual_batch_num = total_batches - idx + 1
             
-            content_size = len(batch_content.encode('utf-8'))
             if total_batches > 1:
                 print(f"  发送第 {actual_batch_num}/{total_batches} 批次（推送顺序: {idx}/{total_batches}），大小：{content_size} 字节")
             
@@ -4,160 +4,19 @@ HTML 报告生成模块
 将新闻数据生成美观的 HTML 报告
 """
 
+import os
+import re
 from datetime import datetime
+from html import escape
 from pathlib import Path
-from typing import Dict, List
-import shutil
-import pytz
+from string import Template
+from typing import Dict, List, TextIO
 
+from simple_news.config import get_timezone
 
-class HTMLReporter:
-    """HTML 报告生成器"""
-
-    def __init__(self, config: Dict, report_dir: Path):
-        """
-        初始化报告生成器
-        
-        Args:
-            config: 配置字典
-            report_dir: 报告输出目录
-        """
-        self.config = config
-        self.reports_dir = Path(report_dir)
-        self.reports_dir.mkdir(parents=True, exist_ok=True)
-        
-        self.timezone = pytz.timezone(config['app']['timezone'])
-        self.rank_threshold = config['report'].get('rank_threshold', 5)
 
-    def generate(
-        self, 
-        keyword_data: List[Dict],
-        platform_data_list: List[Dict],
-        stats: Dict
-    ) -> Path:
-        """
-        生成 HTML 报告
-        
-        Args:
-            keyword_data: 关键词数据列表
-            platform_data_list: 平台数据列表
-            stats: 统计信息
-            
-        Returns:
-            HTML 文件路径
-        """
-        now = datetime.now(self.timezone)
-        timestamp = now.strftime('%Y-%m-%d %H:%M:%S')
-        
-        html_content = self._generate_html(
-            keyword_data, platform_data_list, stats, timestamp
-        )
-        
-        # 只保存为 index.html
-        index_path = self.reports_dir / 'index.html'
-        with open(index_path, 'w', encoding='utf-8') as f:
-            f.write(html_content)
-        
-        return index_path
-
-    def _generate_html(
-        self,
-        keyword_data: List[Dict],
-        platform_data_list: List[Dict],
-        stats: Dict,
-        timestamp: str
-    ) -> str:
-        """生成简约 Tab 风格 HTML 内容"""
-        
-        # 生成 Tab 按钮和内容
-        tabs_html = []
-        sections_html = []
-        tab_index = 0
-        
-        # 关键词新闻作为第一个 Tab（如果有数据）
-        if keyword_data:
-            active_class = 'active' if tab_index == 0 else ''
-            tabs_html.append(f'<button class="tab-btn {active_class}" onclick="switchTab(\'tab_{tab_index}\')">🔍 关键词新闻</button>')
-            
-            keyword_items_html = []
-            for item in keyword_data:
-                group_name = item['group_name']
-                count = item['count']
-                news_list = item['news_list']
-                
-                news_items = []
-                for news in news_list:
-                    rank = news.get('rank', 0)
-                    rank_class = 'hot' if rank <= self.rank_threshold else ''
-                    platform_name = news.get('platform_name', '未知')
-                    title = news.get('title', '')
-                    url = news.get('url', '#')
-                    news_items.append(f'''
-                <div class="news-item">
-                    <a href="{url}" target="_blank" class="news-title">
-                        <span class="rank {rank_class}">#{rank}</span>
-                        <span class="platform">{platform_name}</span>
-                        <span>{title}</span>
-                    </a>
-                </div>''')
-                
-                keyword_items_html.append(f'''
-            <div class="keyword-group">
-                <div class="keyword-header">
-                    <span class="keyword-name">{group_name}</span>
-                    <span class="keyword-count">{count} 条</span>
-                </div>
-                {''.join(news_items)}
-            </div>''')
-            
-            sections_html.append(f'''
-            <div id="tab_{tab_index}" class="platform-section {active_class}">
-                <div class="platform-header">关键词新闻 ({sum(item['count'] for item in keyword_data)} 条)</div>
-                {''.join(keyword_items_html)}
-            </div>''')
-            tab_index += 1
-        
-        # 平台新闻 Tabs
-        for platform_data in platform_data_list:
-            platform_name = platform_data['platform_name']
-            news_list = platform_data['news_list']
-            
-            active_class = 'active' if tab_index == 0 else ''
-            tabs_html.append(f'<button class="tab-btn {active_class}" onclick="switchTab(\'tab_{tab_index}\')">{platform_name}</button>')
-            
-            news_items_html = []
-            for news in news_list:
-                rank = news.get('rank', 0)
-                rank_class = 'hot' if rank <= self.rank_threshold else ''
-                title = news.get('title', '')
-                url = news.get('url', '#')
-                news_items_html.append(f'''
-                <div class="news-item">
-                    <a href="{url}" target="_blank" class="news-title">
-                        <span class="rank {rank_class}">#{rank}</span>
-                        <span>{title}</span>
-                    </a>
-                </div>''')
-            
-            sections_html.append(f'''
-            <div id="tab_{tab_index}" class="platform-section {active_class}">
-                <div class="platform-header">{platform_name} ({len(news_list)} 条)</div>
-                {''.join(news_items_html)}
-            </div>''')
-            tab_index += 1
-        
-        # 计算今日收录总数
-        total_today = stats.get('today_news', 0)
-        
-        # 完整 HTML
-        html = f'''<!DOCTYPE html>
-<html lang="zh-CN">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>Simple News 报告</title>
-    <style>
-        :root {{
+# 报告样式（不随数据变化，定义为模块常量，避免每次生成时在 f-string 中重复转义和拼接）
+_CSS = """        :root {
             --primary-color: #2c3e50;
             --accent-color: #3498db;
             --bg-color: #f5f7fa;
@@ -165,19 +24,19 @@ class HTMLReporter:
             --text-color: #333333;
             --text-secondary: #7f8c8d;
             --border-color: #eaeaea;
-        }}
+        }
 
-        * {{ margin: 0; padding: 0; box-sizing: border-box; }}
+        * { margin: 0; padding: 0; box-sizing: border-box; }
         
-        body {{
+        body {
             font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, "Helvetica Neue", Arial, sans-serif;
             background-color: var(--bg-color);
             color: var(--text-color);
             line-height: 1.6;
             padding: 40px 20px;
-        }}
+        }
         
-        .container {{
+        .container {
             max-width: 1000px;
             margin: 0 auto;
             background: var(--card-bg);
@@ -185,43 +44,43 @@ class HTMLReporter:
             border-radius: 8px;
             overflow: hidden;
             border: 1px solid var(--border-color);
-        }}
+        }
         
-        .header {{
+        .header {
             background: #fff;
             color: var(--primary-color);
             padding: 40px 40px 20px;
             text-align: left;
             border-bottom: 1px solid var(--border-color);
-        }}
+        }
         
-        .header h1 {{ font-size: 2em; margin-bottom: 5px; font-weight: 600; }}
-        .header .subtitle {{ color: var(--text-secondary); font-size: 1em; }}
+        .header h1 { font-size: 2em; margin-bottom: 5px; font-weight: 600; }
+        .header .subtitle { color: var(--text-secondary); font-size: 1em; }
         
-        .stats {{
+        .stats {
             display: flex;
             gap: 40px;
             padding: 20px 40px;
             background: #fff;
             border-bottom: 1px solid var(--border-color);
-        }}
+        }
         
-        .stat-item {{ text-align: left; }}
-        .stat-value {{ font-size: 1.8em; font-weight: 700; color: var(--primary-color); }}
-        .stat-label {{ color: var(--text-secondary); font-size: 0.85em; text-transform: uppercase; }}
+        .stat-item { text-align: left; }
+        .stat-value { font-size: 1.8em; font-weight: 700; color: var(--primary-color); }
+        .stat-label { color: var(--text-secondary); font-size: 0.85em; text-transform: uppercase; }
         
-        .content {{ padding: 40px; }}
+        .content { padding: 40px; }
         
-        .tabs-header {{
+        .tabs-header {
             display: flex;
             gap: 10px;
             flex-wrap: wrap;
             border-bottom: 1px solid var(--border-color);
             margin-bottom: 30px;
             padding-bottom: 0;
-        }}
+        }
 
-        .tab-btn {{
+        .tab-btn {
             background: none;
             border: none;
             padding: 10px 5px;
@@ -231,37 +90,37 @@ class HTMLReporter:
             cursor: pointer;
             margin-bottom: -1px;
             transition: color 0.2s;
-        }}
+        }
 
-        .tab-btn:hover {{ color: var(--primary-color); }}
-        .tab-btn.active {{
+        .tab-btn:hover { color: var(--primary-color); }
+        .tab-btn.active {
             color: var(--primary-color);
             font-weight: 600;
             border-bottom: 2px solid var(--primary-color);
-        }}
+        }
 
-        .platform-section {{ display: none; }}
-        .platform-section.active {{ display: block; animation: fadeIn 0.3s ease; }}
+        .platform-section { display: none; }
+        .platform-section.active { display: block; animation: fadeIn 0.3s ease; }
         
-        .platform-header {{
+        .platform-header {
             font-size: 1.2em;
             font-weight: 600;
             margin-bottom: 15px;
             color: var(--primary-color);
-        }}
+        }
 
-        @keyframes fadeIn {{
-            from {{ opacity: 0; transform: translateY(5px); }}
-            to {{ opacity: 1; transform: translateY(0); }}
-        }}
+        @keyframes fadeIn {
+            from { opacity: 0; transform: translateY(5px); }
+            to { opacity: 1; transform: translateY(0); }
+        }
         
-        .news-item {{
+        .news-item {
             padding: 10px 0;
             border-bottom: 1px solid #f5f5f5;
-        }}
-        .news-item:last-child {{ border-bottom: none; }}
+        }
+        .news-item:last-child { border-bottom: none; }
         
-        .news-title {{
+        .news-title {
             color: var(--text-color);
             text-decoration: none;
             display: flex;
@@ -269,19 +128,19 @@ class HTMLReporter:
             gap: 12px;
             font-size: 1em;
             line-height: 1.5;
-        }}
-        .news-title:hover {{ color: var(--accent-color); }}
+        }
+        .news-title:hover { color: var(--accent-color); }
         
-        .rank {{
+        .rank {
             min-width: 24px;
             text-align: center;
             font-weight: 500;
             color: #b0b0b0;
             font-size: 0.9em;
-        }}
-        .rank.hot {{ color: #ff6b6b; font-weight: 600; }}
+        }
+        .rank.hot { color: #ff6b6b; font-weight: 600; }
         
-        .platform {{
+        .platform {
             display: inline-block;
             background: #e9ecef;
             color: #495057;
@@ -289,45 +148,78 @@ class HTMLReporter:
             border-radius: 4px;
             font-size: 0.8em;
             white-space: nowrap;
-        }}
+        }
         
-        .keyword-group {{
+        .keyword-group {
             margin-bottom: 25px;
             padding-bottom: 20px;
             border-bottom: 1px solid var(--border-color);
-        }}
-        .keyword-group:last-child {{ border-bottom: none; margin-bottom: 0; }}
+        }
+        .keyword-group:last-child { border-bottom: none; margin-bottom: 0; }
         
-        .keyword-header {{
+        .keyword-header {
             display: flex;
             align-items: center;
             gap: 10px;
             margin-bottom: 12px;
-        }}
-        .keyword-name {{ font-weight: 600; color: var(--primary-color); }}
-        .keyword-count {{
+        }
+        .keyword-name { font-weight: 600; color: var(--primary-color); }
+        .keyword-count {
             background: var(--accent-color);
             color: white;
             padding: 2px 10px;
             border-radius: 12px;
             font-size: 0.8em;
-        }}
+        }
         
-        .footer {{
+        .footer {
             padding: 30px;
             text-align: center;
             color: var(--text-secondary);
             font-size: 0.9em;
             border-top: 1px solid var(--border-color);
             background: #fff;
-        }}
-        
-        @media (max-width: 768px) {{
-            body {{ padding: 10px; }}
-            .header, .stats, .content {{ padding: 20px; }}
-            .stats {{ flex-wrap: wrap; gap: 20px; }}
-        }}
-    </style>
+        }
+        
+        @media (max-width: 768px) {
+            body { padding: 10px; }
+            .header, .stats, .content { padding: 20px; }
+            .stats { flex-wrap: wrap; gap: 20px; }
+        }
+"""
+
+# 写入报告时使用的压缩版样式：导入时去掉注释并合并空白，只计算一次
+_CSS_MIN = re.sub(r'/\*.*?\*/', '', _CSS, flags=re.S)
+_CSS_MIN = re.sub(r'\s+', ' ', _CSS_MIN)
+_CSS_MIN = re.sub(r'\s*([{};,])\s*', r'\1', _CSS_MIN).strip()
+
+# Tab 切换脚本
+_JS = """        function switchTab(tabId) {
+            document.querySelectorAll('.platform-section').forEach(el => {
+                el.classList.remove('active');
+            });
+            document.querySelectorAll('.tab-btn').forEach(el => {
+                el.classList.remove('active');
+            });
+            const section = document.getElementById(tabId);
+            if (section) {
+                section.classList.add('active');
+            }
+            const btn = document.querySelector(`button[onclick="switchTab('${tabId}')"]`);
+            if (btn) {
+                btn.classList.add('active');
+            }
+        }
+"""
+
+# 页面骨架（string.Template 以 $ 占位，样式和脚本作为整体代入，无需转义花括号）
+_PAGE_HEAD = Template('''<!DOCTYPE html>
+<html lang="zh-CN">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>Simple News 报告</title>
+    $styles
 </head>
 <body>
     <div class="container">
@@ -338,131 +230,257 @@ class HTMLReporter:
         
         <div class="stats">
             <div class="stat-item">
-                <div class="stat-value">{total_today}</div>
+                <div class="stat-value">$total_today</div>
                 <div class="stat-label">今日总收录</div>
             </div>
         </div>
         
         <div class="content">
             <div class="tabs-header" id="platformTabs">
-                {''.join(tabs_html)}
+                $tabs
             </div>
 
-            {''.join(sections_html)}
+            ''')
+_PAGE_TAIL = Template('''
         </div>
         
         <div class="footer">
-            Generated by Simple News Monitor • {timestamp}
+            Generated by Simple News Monitor • $timestamp
         </div>
     </div>
 
-    <script>
-        function switchTab(tabId) {{
-            document.querySelectorAll('.platform-section').forEach(el => {{
-                el.classList.remove('active');
-            }});
-            document.querySelectorAll('.tab-btn').forEach(el => {{
-                el.classList.remove('active');
-            }});
-            const section = document.getElementById(tabId);
-            if (section) {{
-                section.classList.add('active');
-            }}
-            const btn = document.querySelector(`button[onclick="switchTab('${{tabId}}')"]`);
-            if (btn) {{
-                btn.classList.add('active');
-            }}
-        }}
-    </script>
+    $scripts
 </body>
-</html>'''
+</html>''')
+
+# 单条新闻的 HTML 模板（% 格式化，字段依次为：链接、排名样式、排名、[平台名、]标题）
+_KEYWORD_NEWS_ITEM = (
+    '\n                <div class="news-item">'
+    '\n                    <a href="%s" target="_blank" class="news-title">'
+    '\n                        <span class="rank %s">#%s</span>'
+    '\n                        <span class="platform">%s</span>'
+    '\n                        <span>%s</span>'
+    '\n                    </a>'
+    '\n                </div>'
+)
+_PLATFORM_NEWS_ITEM = (
+    '\n                <div class="news-item">'
+    '\n                    <a href="%s" target="_blank" class="news-title">'
+    '\n                        <span class="rank %s">#%s</span>'
+    '\n                        <span>%s</span>'
+    '\n                    </a>'
+    '\n                </div>'
+)
+
+
+def _row(news: Dict, _get=dict.get) -> tuple:
+    """
+    一次取出渲染单条新闻所需的字段
+    
+    Args:
+        news: 新闻数据
+        
+    Returns:
+        (排名, 平台名, 标题, 链接) 元组
+    """
+    return (
+        _get(news, 'rank', 0),
+        _get(news, 'platform_name', '未知'),
+        _get(news, 'title', ''),
+        _get(news, 'url', '#'),
+    )
+
+
+class HTMLReporter:
+    """HTML 报告生成器"""
+
+    def __init__(self, config: Dict, report_dir: Path):
+        """
+        初始化报告生成器
         
-        return html
+        Args:
+            config: 配置字典
+            report_dir: 报告输出目录
+        """
+        self.config = config
+        self.reports_dir = Path(report_dir)
+        self.reports_dir.mkdir(parents=True, exist_ok=True)
+        self._index_path = self.reports_dir / 'index.html'
+        
+        self.timezone = get_timezone(config['app']['timezone'])
+        self.rank_threshold = config['report'].get('rank_threshold', 5)
+        
+        # 样式和脚本默认写到 assets/ 下由报告引用，浏览器可跨报告缓存；
+        # 关闭后仍内嵌到每份报告中，生成自包含的单文件
+        if config['report'].get('external_assets', True):
+            self._write_assets()
+            self._styles = '<link rel="stylesheet" href="assets/style.css">'
+            self._scripts = '<script src="assets/app.js"></script>'
+        else:
+            self._styles = f'<style>{_CSS_MIN}</style>'
+            self._scripts = f'<script>\n{_JS}    </script>'
+
+    def _write_assets(self):
+        """将样式和脚本写入报告目录下的 assets/（内容未变化时跳过写入）"""
+        assets_dir = self.reports_dir / 'assets'
+        assets_dir.mkdir(exist_ok=True)
+        
+        for name, content in (('style.css', _CSS_MIN), ('app.js', _JS)):
+            data = content.encode('utf-8')
+            path = assets_dir / name
+            if not path.exists() or path.read_bytes() != data:
+                path.write_bytes(data)
 
-    def _generate_keyword_section(self, keyword_data: List[Dict]) -> str:
-        """生成关键词统计部分"""
-        if not keyword_data:
-            return '<div class="section"><div class="section-title">🔍 关键词统计</div><p>暂无关键词匹配</p></div>'
+    def generate(
+        self, 
+        keyword_data: List[Dict],
+        platform_data_list: List[Dict],
+        stats: Dict
+    ) -> Path:
+        """
+        生成 HTML 报告
         
-        items_html = []
-        for item in keyword_data:
-            group_name = item['group_name']  # 使用组名
-            count = item['count']
-            news_list = item['news_list']
-            
-            news_items_html = []
-            for news in news_list:
-                rank = news.get('rank', 0)
-                rank_class = 'hot' if rank <= self.rank_threshold else ''
-                platform_name = news.get('platform_name', '未知')
-                title = news.get('title', '')
-                url = news.get('url', '#')
-                
-                news_items_html.append(f'''
-                <div class="news-item">
-                    <a href="{url}" target="_blank" class="news-title">
-                        <span class="rank {rank_class}">#{rank}</span>
-                        <span class="platform">{platform_name}</span>
-                        <span>{title}</span>
-                    </a>
-                </div>
-                ''')
+        Args:
+            keyword_data: 关键词数据列表
+            platform_data_list: 平台数据列表
+            stats: 统计信息
             
-            items_html.append(f'''
-            <div class="keyword-item">
-                <div class="keyword-header">
-                    <span class="keyword-name">{group_name}</span>
-                    <span class="keyword-count">{count} 条</span>
-                </div>
-                <div class="keyword-news">
-                    {''.join(news_items_html)}
-                </div>
-            </div>
-            ''')
+        Returns:
+            HTML 文件路径
+        """
+        now = datetime.now(self.timezone)
+        timestamp = now.strftime('%Y-%m-%d %H:%M:%S')
+        tail = _PAGE_TAIL.substitute(timestamp=timestamp, scripts=self._scripts)
+        index_path = self._index_path
+        
+        # 只保存为 index.html（边生成边写入缓冲文件，不在内存中拼出整页）
+        # 先写同目录下的临时文件，完整写完后再替换，生成出错时保留上一份完整报告
+        tmp_path = index_path.with_name(index_path.name + '.tmp')
+        try:
+            with open(tmp_path, 'w', encoding='utf-8', buffering=65536) as fh:
+                self._write_body(fh, keyword_data, platform_data_list, stats)
+                fh.write(tail)
+            os.replace(tmp_path, index_path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
         
-        return f'''
-        <div class="section">
-            <div class="section-title">🔍 关键词统计</div>
-            {''.join(items_html)}
-        </div>
-        '''
+        return index_path
 
-    def _generate_platform_section(self, platform_data_list: List[Dict]) -> str:
-        """生成平台新闻部分"""
-        if not platform_data_list:
-            return ''
+    def _write_body(
+        self,
+        fh: TextIO,
+        keyword_data: List[Dict],
+        platform_data_list: List[Dict],
+        stats: Dict
+    ) -> None:
+        """
+        生成简约 Tab 风格 HTML 正文（页面尾部之前的全部内容）并写入文件
+        
+        Args:
+            fh: 已打开的文本文件
+            keyword_data: 关键词数据列表
+            platform_data_list: 平台数据列表
+            stats: 统计信息
+        """
+        # Tab 按钮位于各内容区之前，先生成（体积很小）
+        # 标题、链接、平台名等来自第三方接口，写入 HTML 前统一转义
+        tabs_html = []
+        tab_names = (['🔍 关键词新闻'] if keyword_data else []) + [
+            escape(platform_data['platform_name']) for platform_data in platform_data_list
+        ]
+        for tab_index, tab_name in enumerate(tab_names):
+            active_class = 'active' if tab_index == 0 else ''
+            tabs_html.append(f'<button class="tab-btn {active_class}" onclick="switchTab(\'tab_{tab_index}\')">{tab_name}</button>')
         
-        platforms_html = []
+        # 计算今日收录总数
+        total_today = stats.get('today_news', 0)
+        
+        fh.write(_PAGE_HEAD.substitute(styles=self._styles, total_today=total_today, tabs=''.join(tabs_html)))
+        
+        # 各 Tab 内容逐段写入
+        tab_index = 0
+        
+        # 关键词新闻作为第一个 Tab（如果有数据）
+        if keyword_data:
+            self._write_keyword_section(fh, keyword_data, tab_index)
+            tab_index += 1
+        
+        # 平台新闻 Tabs
         for platform_data in platform_data_list:
-            platform_name = platform_data['platform_name']
-            news_list = platform_data['news_list']
+            self._write_platform_section(fh, platform_data, tab_index)
+            tab_index += 1
+
+    def _write_keyword_section(self, fh: TextIO, keyword_data: List[Dict], tab_index: int) -> None:
+        """
+        写入关键词新闻 Tab 内容
+        
+        Args:
+            fh: 已打开的文本文件
+            keyword_data: 关键词数据列表
+            tab_index: Tab 序号
+        """
+        active_class = 'active' if tab_index == 0 else ''
+        threshold = self.rank_threshold
+        # 关键词新闻总数在写入前算好，不在格式化过程中遍历
+        kw_total = sum(item['count'] for item in keyword_data)
+        
+        fh.write(f'''
+            <div id="tab_{tab_index}" class="platform-section {active_class}">
+                <div class="platform-header">关键词新闻 ({kw_total} 条)</div>''')
+        
+        for item in keyword_data:
+            fh.write(
+                '\n            <div class="keyword-group">\n                <div class="keyword-header">\n                    <span class="keyword-name">'
+                f'{escape(item["group_name"])}</span>\n                    <span class="keyword-count">{item["count"]} 条</span>\n                </div>'
+            )
             
-            news_items_html = []
-            for news in news_list:
-                rank = news.get('rank', 0)
-                rank_class = 'hot' if rank <= self.rank_threshold else ''
-                title = news.get('title', '')
-                url = news.get('url', '#')
-                
-                news_items_html.append(f'''
-                <div class="news-item">
-                    <a href="{url}" target="_blank" class="news-title">
-                        <span class="rank {rank_class}">#{rank}</span>
-                        <span>{title}</span>
-                    </a>
-                </div>
-                ''')
+            # 先批量取出字段并算出排名样式，再将每条新闻的字段一次性转义后套用模板
+            rows = [_row(news) for news in item['news_list']]
+            rank_classes = ['hot' if row[0] <= threshold else '' for row in rows]
+            fh.writelines(
+                _KEYWORD_NEWS_ITEM % (
+                    escape(url or '#'),
+                    rank_class,
+                    rank,
+                    escape(platform_name),
+                    escape(title),
+                )
+                for (rank, platform_name, title, url), rank_class in zip(rows, rank_classes)
+            )
             
-            platforms_html.append(f'''
-            <div class="platform-section">
-                <div class="platform-header">{platform_name} ({len(news_list)} 条)</div>
-                {''.join(news_items_html)}
-            </div>
-            ''')
+            fh.write('\n            </div>')
         
-        return f'''
-        <div class="section">
-            <div class="section-title">📱 平台新闻</div>
-            {''.join(platforms_html)}
-        </div>
-        '''
+        fh.write('\n            </div>')
+
+    def _write_platform_section(self, fh: TextIO, platform_data: Dict, tab_index: int) -> None:
+        """
+        写入单个平台新闻 Tab 内容
+        
+        Args:
+            fh: 已打开的文本文件
+            platform_data: 平台数据
+            tab_index: Tab 序号
+        """
+        active_class = 'active' if tab_index == 0 else ''
+        threshold = self.rank_threshold
+        platform_name = escape(platform_data['platform_name'])
+        news_list = platform_data['news_list']
+        
+        fh.write(f'''
+            <div id="tab_{tab_index}" class="platform-section {active_class}">
+                <div class="platform-header">{platform_name} ({len(news_list)} 条)</div>''')
+        
+        rows = [_row(news) for news in news_list]
+        rank_classes = ['hot' if row[0] <= threshold else '' for row in rows]
+        fh.writelines(
+            _PLATFORM_NEWS_ITEM % (
+                escape(url or '#'),
+                rank_class,
+                rank,
+                escape(title),
+            )
+            for (rank, _, title, url), rank_class in zip(rows, rank_classes)
+        )
+        
+        fh.write('\n            </div>')
@@ -4,12 +4,44 @@
 负责将新闻数据保存到 SQLite 数据库
 """
 
+import atexit
+import os
 import sqlite3
+from contextlib import closing
 from datetime import datetime, timedelta
+from functools import lru_cache
+from itertools import chain, groupby, islice
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, List, Optional
-import pytz
-from simple_news.topic_classifier import classify_title
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+from simple_news.config import get_timezone
+from simple_news.topic_classifier import classify_title_compiled, compile_topics
+
+# 查询新闻时返回的列（顺序即结果字典的键顺序）
+_NEWS_COLS = (
+    'id', 'platform_id', 'platform_name', 'title', 'url', 'mobile_url', 'rank',
+    'crawl_time', 'topic', 'topic_score', 'topic_reason', 'date', 'created_at',
+)
+_NEWS_SELECT = ', '.join(f'n.{col}' for col in _NEWS_COLS)
+
+# 统计时每批 ATTACH 的数据库数（SQLite 默认最多同时附加 10 个）
+_ATTACH_BATCH = 8
+
+
+def _iter_rows(cursor: sqlite3.Cursor, columns: Tuple[str, ...] = _NEWS_COLS, size: int = 1000) -> Iterator[Dict]:
+    """
+    分批从游标取出结果并逐行转换为字典
+    
+    Args:
+        cursor: 已执行查询的游标（结果列与 columns 一一对应）
+        columns: 结果列名
+        size: 每批取回的行数
+    
+    Returns:
+        行字典迭代器
+    """
+    for batch in iter(lambda: cursor.fetchmany(size), []):
+        yield from (dict(zip(columns, row)) for row in batch)
 
 
 class NewsStorage:
@@ -30,11 +62,21 @@ class NewsStorage:
         self.data_dir.mkdir(parents=True, exist_ok=True)
         
         # 时区
-        self.timezone = pytz.timezone(config['app']['timezone'])
+        self.timezone = get_timezone(config['app']['timezone'])
         
         # 保留天数
         self.retention_days = storage_config.get('retention_days', 30)
         
+        # 主题规则只预处理一次，入库和回填分类时复用
+        self._topics = compile_topics(config.get('topics', {}))
+        
+        # 已打开的数据库连接（按文件路径缓存，只在主线程中使用）
+        self._conns: Dict[Path, sqlite3.Connection] = {}
+        # 本进程内已完成表结构初始化的数据库（连接关闭后重新打开时无需再建表）
+        self._initialized: Set[Path] = set()
+        # 调用方忘记 close() 时，进程退出前也会关闭缓存的连接（close 可重复调用）
+        atexit.register(self.close)
+        
         # 迁移旧数据库（如果存在）
         self._migrate_from_single_db()
     
@@ -49,7 +91,7 @@ class NewsStorage:
             数据库文件路径
         """
         if date is None:
-            date = datetime.now(self.timezone).strftime('%Y-%m-%d')
+            date, _ = self._now_parts()
         
         # 格式化为 YYYYMMDD
         date_str = date.replace('-', '')
@@ -57,16 +99,80 @@ class NewsStorage:
         
         return self.data_dir / db_filename
 
+    def _now_parts(self) -> Tuple[str, str]:
+        """
+        获取当前日期和时间字符串（只读取一次时钟、格式化一次）
+        
+        Returns:
+            (日期 YYYY-MM-DD, 时间 YYYY-MM-DD HH:MM:SS)
+        """
+        timestamp = datetime.now(self.timezone).strftime('%Y-%m-%d %H:%M:%S')
+        return timestamp[:10], timestamp
 
+    def _connect(self, db_path: Path) -> sqlite3.Connection:
+        """
+        打开数据库连接并设置性能相关的 PRAGMA
+        
+        Args:
+            db_path: 数据库文件路径
+            
+        Returns:
+            数据库连接
+        """
+        conn = sqlite3.connect(db_path, timeout=30)
+        # WAL 模式写入时无需每次提交都同步整个数据库文件，
+        # 配合 synchronous=NORMAL 在断电时最多丢失最后一次提交，不会损坏数据库
+        # journal_mode 会持久化到数据库文件中，其余设置每个连接都要重新指定
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA cache_size=-65536")  # 64MB
+        conn.execute("PRAGMA mmap_size=268435456")  # 256MB
+        return conn
 
-    def _init_database_for_path(self, db_path: Path):
+    def _get_conn(self, db_path: Path) -> sqlite3.Connection:
         """
-        为指定路径初始化数据库表
+        获取指定数据库的长连接，首次使用时打开，表结构每个文件只初始化一次
         
         Args:
             db_path: 数据库文件路径
+            
+        Returns:
+            数据库连接
+        """
+        conn = self._conns.get(db_path)
+        if conn is None:
+            conn = self._connect(db_path)
+            if db_path not in self._initialized:
+                self._init_database(conn)
+                self._initialized.add(db_path)
+            self._conns[db_path] = conn
+        return conn
+
+    def _close_conn(self, db_path: Path):
+        """
+        关闭并移除指定数据库的缓存连接（如有）
+        
+        Args:
+            db_path: 数据库文件路径
+        """
+        conn = self._conns.pop(db_path, None)
+        if conn is not None:
+            conn.close()
+
+    def close(self):
+        """关闭所有缓存的数据库连接"""
+        for db_path in list(self._conns):
+            self._close_conn(db_path)
+
+    def _init_database(self, conn: sqlite3.Connection):
+        """
+        初始化数据库表
+        
+        Args:
+            conn: 数据库连接
         """
-        with sqlite3.connect(db_path) as conn:
+        with conn:
             cursor = conn.cursor()
             
             # 新闻表
@@ -98,10 +204,8 @@ class NewsStorage:
                 cursor.execute("ALTER TABLE news ADD COLUMN topic_reason TEXT DEFAULT ''")
             
             # 创建索引
-            cursor.execute('''
-                CREATE INDEX IF NOT EXISTS idx_news_date 
-                ON news(date)
-            ''')
+            # 按日期过滤由下面以 date 开头的复合索引覆盖，单列的 idx_news_date 已多余
+            cursor.execute("DROP INDEX IF EXISTS idx_news_date")
             
             cursor.execute('''
                 CREATE INDEX IF NOT EXISTS idx_news_platform 
@@ -113,11 +217,56 @@ class NewsStorage:
                 ON news(topic, date)
             ''')
 
-            # 兼容历史默认值
-            cursor.execute("UPDATE news SET topic='other' WHERE topic='general'")
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_news_date_crawl
+                ON news(date, crawl_time)
+            ''')
 
-            # 对旧数据做一次主题回填，确保历史数据也可按主题筛选
-            self._backfill_topics(conn)
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_news_title_date
+                ON news(date, title)
+            ''')
+
+            # daily 模式按该顺序输出，沿索引顺序扫描即可省去排序
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_news_daily
+                ON news(date, created_at DESC, platform_id, rank)
+            ''')
+
+            # 同一天同一平台的同一标题只保留一行，由 INSERT OR IGNORE 在写入时去重
+            has_unique = cursor.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = 'uq_news'"
+            ).fetchone()
+            if not has_unique:
+                # 兼容已有数据库：先删除重复行，只保留最早入库的一条
+                cursor.execute('''
+                    DELETE FROM news
+                    WHERE id NOT IN (SELECT MIN(id) FROM news GROUP BY date, platform_id, title)
+                ''')
+                cursor.execute('''
+                    CREATE UNIQUE INDEX uq_news
+                    ON news(date, platform_id, title)
+                ''')
+
+            # 库级元信息（记录一次性的数据修复是否已完成）
+            cursor.execute('''
+                CREATE TABLE IF NOT EXISTS meta (
+                    k TEXT PRIMARY KEY,
+                    v TEXT
+                )
+            ''')
+
+            backfilled = cursor.execute(
+                "SELECT 1 FROM meta WHERE k = 'topics_backfilled'"
+            ).fetchone()
+            if not backfilled:
+                # 兼容历史默认值
+                cursor.execute("UPDATE news SET topic='other' WHERE topic='general'")
+
+                # 对旧数据做一次主题回填，确保历史数据也可按主题筛选
+                # 之后写入的新闻（含迁移数据）入库时即已分类，无需再次扫描
+                self._backfill_topics(conn)
+                cursor.execute("INSERT OR IGNORE INTO meta (k, v) VALUES ('topics_backfilled', '1')")
             
             # 关键词统计表
             cursor.execute('''
@@ -134,57 +283,80 @@ class NewsStorage:
                 CREATE INDEX IF NOT EXISTS idx_keyword_date 
                 ON keyword_stats(date)
             ''')
+
+            # 同一关键词每天只保留一行，重复写入时累加次数
+            has_unique = cursor.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = 'idx_keyword_unique'"
+            ).fetchone()
+            if not has_unique:
+                # 兼容已有数据库：先把同一天的重复行合并到 id 最小的一行
+                cursor.execute('''
+                    UPDATE keyword_stats
+                    SET count = (
+                        SELECT SUM(k.count) FROM keyword_stats k
+                        WHERE k.keyword = keyword_stats.keyword AND k.date = keyword_stats.date
+                    )
+                    WHERE id IN (
+                        SELECT MIN(id) FROM keyword_stats
+                        GROUP BY keyword, date HAVING COUNT(*) > 1
+                    )
+                ''')
+                cursor.execute('''
+                    DELETE FROM keyword_stats
+                    WHERE id NOT IN (SELECT MIN(id) FROM keyword_stats GROUP BY keyword, date)
+                ''')
+                cursor.execute('''
+                    CREATE UNIQUE INDEX idx_keyword_unique
+                    ON keyword_stats(keyword, date)
+                ''')
+            
+            # 推送记录表 (用于去重)，按 (title, date) 主键直接组织，查询无需回表
+            pushed_cols = {row[1] for row in cursor.execute("PRAGMA table_info(pushed_news)").fetchall()}
+            if 'id' in pushed_cols:
+                # 兼容已有数据库：旧表带自增 id，重建为 WITHOUT ROWID 表（重复记录保留最早的一条）
+                cursor.execute("ALTER TABLE pushed_news RENAME TO pushed_news_old")
+                cursor.execute("DROP INDEX IF EXISTS idx_pushed_title")
             
-            # 推送记录表 (用于去重)
             cursor.execute('''
                 CREATE TABLE IF NOT EXISTS pushed_news (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
                     title TEXT NOT NULL,
                     date TEXT NOT NULL,
-                    created_at TEXT NOT NULL
-                )
+                    created_at TEXT NOT NULL,
+                    PRIMARY KEY (title, date)
+                ) WITHOUT ROWID
             ''')
             
-            cursor.execute('''
-                CREATE INDEX IF NOT EXISTS idx_pushed_title 
-                ON pushed_news(title, date)
-            ''')
+            if 'id' in pushed_cols:
+                cursor.execute('''
+                    INSERT OR IGNORE INTO pushed_news (title, date, created_at)
+                    SELECT title, date, created_at FROM pushed_news_old ORDER BY id
+                ''')
+                cursor.execute("DROP TABLE pushed_news_old")
             
             conn.commit()
 
     def _backfill_topics(self, conn: sqlite3.Connection):
         """为历史未分类新闻补齐 topic/topic_score/topic_reason。"""
-        cursor = conn.cursor()
-        rows = cursor.execute(
+        # 分类函数注册为 SQLite 自定义函数，由一条 UPDATE 流式处理所有待回填的行
+        # 同一行的三个字段依次求值，缓存最近一个标题的结果即可只分类一次
+        classify = lru_cache(maxsize=1)(
+            lambda title: classify_title_compiled(title, self._topics, default_topic='other')
+        )
+        conn.create_function(
+            'classify_topic', 2, lambda title, index: classify(title)[index], deterministic=True
+        )
+        conn.execute(
             '''
-            SELECT id, title
-            FROM news
+            UPDATE news
+            SET
+                topic = classify_topic(title, 0),
+                topic_score = classify_topic(title, 1),
+                topic_reason = classify_topic(title, 2)
             WHERE
                 topic IS NULL OR topic = '' OR
                 topic_score IS NULL OR topic_score = 0 OR
                 topic_reason IS NULL OR topic_reason = ''
             '''
-        ).fetchall()
-        if not rows:
-            return
-
-        topics_conf = self.config.get('topics', {})
-        updates = []
-        for row_id, title in rows:
-            topic, topic_score, topic_reason = classify_title(
-                title,
-                topics_conf,
-                default_topic='other',
-            )
-            updates.append((topic, topic_score, topic_reason, row_id))
-
-        cursor.executemany(
-            '''
-            UPDATE news
-            SET topic = ?, topic_score = ?, topic_reason = ?
-            WHERE id = ?
-            ''',
-            updates,
         )
 
     def is_pushed(self, title: str) -> bool:
@@ -197,19 +369,53 @@ class NewsStorage:
         Returns:
             是否已推送
         """
-        today = datetime.now(self.timezone).strftime('%Y-%m-%d')
+        today, _ = self._now_parts()
         db_path = self._get_db_path(today)
         
         if not db_path.exists():
             return False
             
-        with sqlite3.connect(db_path) as conn:
+        with self._get_conn(db_path) as conn:
             cursor = conn.cursor()
             cursor.execute(
-                "SELECT 1 FROM pushed_news WHERE title = ? AND date = ?", 
+                "SELECT EXISTS (SELECT 1 FROM pushed_news WHERE title = ? AND date = ?)",
                 (title, today)
             )
-            return cursor.fetchone() is not None
+            return bool(cursor.fetchone()[0])
+
+    def already_pushed(self, titles: List[str]) -> Set[str]:
+        """
+        批量检查标题是否已在今天推送过
+        
+        Args:
+            titles: 标题列表
+            
+        Returns:
+            其中已推送过的标题集合
+        """
+        if not titles:
+            return set()
+        
+        today, _ = self._now_parts()
+        db_path = self._get_db_path(today)
+        
+        if not db_path.exists():
+            return set()
+        
+        unique_titles = list(dict.fromkeys(titles))
+        pushed = set()
+        with self._get_conn(db_path) as conn:
+            cursor = conn.cursor()
+            # 分批查询，单条语句的参数个数不超过 SQLite 上限（旧版本默认 999）
+            for start in range(0, len(unique_titles), 900):
+                batch = unique_titles[start:start + 900]
+                placeholders = ', '.join('?' * len(batch))
+                cursor.execute(
+                    f"SELECT title FROM pushed_news WHERE date = ? AND title IN ({placeholders})",
+                    (today, *batch)
+                )
+                pushed.update(row[0] for row in cursor.fetchall())
+        return pushed
 
     def mark_pushed(self, titles: List[str]):
         """
@@ -221,19 +427,14 @@ class NewsStorage:
         if not titles:
             return
             
-        now = datetime.now(self.timezone)
-        created_at = now.strftime('%Y-%m-%d %H:%M:%S')
-        today = now.strftime('%Y-%m-%d')
+        today, created_at = self._now_parts()
         db_path = self._get_db_path(today)
         
-        # 确保表存在
-        self._init_database_for_path(db_path)
-            
-        with sqlite3.connect(db_path) as conn:
+        with self._get_conn(db_path) as conn:
             cursor = conn.cursor()
             data = [(title, today, created_at) for title in titles]
             cursor.executemany(
-                "INSERT INTO pushed_news (title, date, created_at) VALUES (?, ?, ?)",
+                "INSERT OR IGNORE INTO pushed_news (title, date, created_at) VALUES (?, ?, ?)",
                 data
             )
             conn.commit()
@@ -251,13 +452,13 @@ class NewsStorage:
         if not news_list:
             return []
             
-        today = datetime.now(self.timezone).strftime('%Y-%m-%d')
+        today, _ = self._now_parts()
         db_path = self._get_db_path(today)
         
         if not db_path.exists():
             return news_list
             
-        with sqlite3.connect(db_path) as conn:
+        with self._get_conn(db_path) as conn:
             cursor = conn.cursor()
             # 获取今天所有已推送的标题
             cursor.execute("SELECT title FROM pushed_news WHERE date = ?", (today,))
@@ -278,60 +479,72 @@ class NewsStorage:
         
         print("🔄 检测到旧数据库，开始迁移...")
         
+        required = [
+            'platform_id', 'platform_name', 'title', 'url', 'mobile_url',
+            'rank', 'crawl_time', 'date', 'created_at'
+        ]
+        
         try:
-            # 读取所有数据
-            with sqlite3.connect(old_db) as conn:
-                cursor = conn.cursor()
-                cursor.execute("SELECT * FROM news")
-                rows = cursor.fetchall()
-                columns = [d[0] for d in cursor.description] if cursor.description else []
-            
-            if not rows:
-                print("  旧数据库为空，跳过迁移")
-                return
-            
-            # 按日期分组
-            from collections import defaultdict
-            by_date = defaultdict(list)
-            
-            col_idx = {name: i for i, name in enumerate(columns)}
-            required = [
-                'id', 'platform_id', 'platform_name', 'title', 'url', 'mobile_url',
-                'rank', 'crawl_time', 'date', 'created_at'
-            ]
-            for row in rows:
-                # 兼容旧/新结构：按列名映射，不依赖固定索引
-                mapped = []
-                for col in required:
-                    idx = col_idx.get(col)
-                    mapped.append(row[idx] if idx is not None else None)
-                date = mapped[8]
-                if not date:
-                    continue
-                by_date[date].append(tuple(mapped))
-            
-            # 写入各日期数据库
+            read_count = 0
             migrated_count = 0
-            for date, news_list in by_date.items():
-                db_path = self._get_db_path(date)
-                self._init_database_for_path(db_path)
+            
+            with closing(sqlite3.connect(old_db)) as old_conn:
+                cursor = old_conn.cursor()
+                cursor.arraysize = 10000
                 
-                with sqlite3.connect(db_path) as conn:
-                    conn.executemany(
-                        '''INSERT INTO news (
-                            id, platform_id, platform_name, title, url, mobile_url,
-                            rank, crawl_time, date, created_at
-                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)''',
-                        news_list
-                    )
-                    migrated_count += len(news_list)
+                # 兼容旧/新结构：按列名选取，旧表缺少的列以 NULL 补齐
+                cursor.execute("SELECT * FROM news LIMIT 0")
+                columns = {d[0] for d in cursor.description}
+                select_cols = ', '.join(col if col in columns else 'NULL' for col in required)
                 
-                print(f"  ✓ {date}: {len(news_list)} 条新闻")
+                # 按日期排序后分块读取，同一日期的数据连续出现
+                cursor.execute(f'''
+                    SELECT {select_cols} FROM news
+                    WHERE date IS NOT NULL AND date != ''
+                    ORDER BY date
+                ''')
+                rows = chain.from_iterable(iter(cursor.fetchmany, []))
+                
+                # 写入各日期数据库：每个日期一个事务，不保留旧表的 id，由新库自增生成
+                # 主题在写入时直接分类（新库的一次性回填在建库时已经完成）
+                for date, news_rows in groupby(rows, key=itemgetter(7)):
+                    db_path = self._get_db_path(date)
+                    conn = self._get_conn(db_path)
+                    
+                    # 单个日期数据量很大时按 5000 行分块提交，控制单个事务和 WAL 的大小
+                    # （INSERT OR IGNORE 保证中途失败后重新迁移不会产生重复）
+                    count = 0
+                    for chunk in iter(lambda: list(islice(news_rows, 5000)), []):
+                        read_count += len(chunk)
+                        with conn:
+                            count += conn.executemany(
+                                '''INSERT OR IGNORE INTO news (
+                                    platform_id, platform_name, title, url, mobile_url,
+                                    rank, crawl_time, date, created_at,
+                                    topic, topic_score, topic_reason
+                                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)''',
+                                (
+                                    row + classify_title_compiled(row[2], self._topics, default_topic='other')
+                                    for row in chunk
+                                )
+                            ).rowcount
+                    migrated_count += count
+                    # 历史日期的数据库迁移完即可关闭
+                    self._close_conn(db_path)
+                    
+                    print(f"  ✓ {date}: {count} 条新闻")
+            
+            # 是否为空按读取的行数判断：上次迁移写完数据但未来得及备份时，
+            # 本次所有行都会被忽略，仍需完成备份，避免每次启动都重新扫描旧库
+            if not read_count:
+                print("  旧数据库为空，跳过迁移")
+                return
             
             # 备份并删除旧数据库
             backup_path = self.data_dir / 'news.db.backup'
             old_db.rename(backup_path)
-            print(f"✓ 迁移完成！共迁移 {migrated_count} 条新闻")
+            skipped = read_count - migrated_count
+            print(f"✓ 迁移完成！共迁移 {migrated_count} 条新闻" + (f"（跳过已存在 {skipped} 条）" if skipped else ""))
             print(f"  旧数据库已备份为: {backup_path.name}")
             
         except Exception as e:
@@ -350,52 +563,39 @@ class NewsStorage:
         """
         now = datetime.now(self.timezone)
         crawl_time = now.strftime('%Y-%m-%d %H:%M:%S')
-        date = now.strftime('%Y-%m-%d')
+        date = crawl_time[:10]
         
         # 获取当天数据库路径
         db_path = self._get_db_path(date)
         
-        # 初始化数据库（如果不存在）
-        self._init_database_for_path(db_path)
-        
-        total_saved = 0
-        total_skipped = 0
-        
-        with sqlite3.connect(db_path) as conn:
+        with self._get_conn(db_path) as conn:
             cursor = conn.cursor()
-
-            # 预加载当日已存在的 (platform_id, title)，避免重复入库
-            cursor.execute('''
-                SELECT platform_id, title FROM news WHERE date = ?
-            ''', (date,))
-            existing_keys = {(row[0], row[1]) for row in cursor.fetchall()}
-            batch_keys = set()
             
+            # 先组装好所有待插入的行，再一次 executemany 写入
+            # 当日已存在的 (platform_id, title) 由 uq_news 唯一索引忽略
+            rows = []
+            # 同一标题常出现在多个平台，分类结果按标题缓存
+            topic_cache: Dict[str, Tuple[str, float, str]] = {}
             for platform_data in platform_data_list:
                 platform_id = platform_data['platform_id']
                 platform_name = platform_data['platform_name']
                 
                 for news_item in platform_data['news_list']:
-                    dedup_key = (platform_id, news_item['title'])
-                    if dedup_key in existing_keys or dedup_key in batch_keys:
-                        total_skipped += 1
-                        continue
-
-                    topic, topic_score, topic_reason = classify_title(
-                        news_item['title'],
-                        self.config.get('topics', {}),
-                        default_topic='other'
-                    )
+                    title = news_item['title']
+                    classified = topic_cache.get(title)
+                    if classified is None:
+                        classified = classify_title_compiled(
+                            title,
+                            self._topics,
+                            default_topic='other'
+                        )
+                        topic_cache[title] = classified
+                    topic, topic_score, topic_reason = classified
 
-                    cursor.execute('''
-                        INSERT INTO news (
-                            platform_id, platform_name, title, url, mobile_url,
-                            rank, crawl_time, topic, topic_score, topic_reason, date, created_at
-                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    ''', (
+                    rows.append((
                         platform_id,
                         platform_name,
-                        news_item['title'],
+                        title,
                         news_item['url'],
                         news_item['mobile_url'],
                         news_item['rank'],
@@ -406,8 +606,16 @@ class NewsStorage:
                         date,
                         crawl_time,
                     ))
-                    batch_keys.add(dedup_key)
-                    total_saved += 1
+            
+            cursor.executemany('''
+                INSERT OR IGNORE INTO news (
+                    platform_id, platform_name, title, url, mobile_url,
+                    rank, crawl_time, topic, topic_score, topic_reason, date, created_at
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ''', rows)
+            # executemany 的 rowcount 是实际插入行数之和，被忽略的重复行不计入
+            total_saved = cursor.rowcount
+            total_skipped = len(rows) - total_saved
             
             conn.commit()
         
@@ -415,7 +623,7 @@ class NewsStorage:
         
         # 清理旧数据
         if self.retention_days > 0:
-            self._cleanup_old_data()
+            self._cleanup_old_data(now)
         
         return total_saved
 
@@ -429,21 +637,17 @@ class NewsStorage:
         if not keyword_stats:
             return
         
-        now = datetime.now(self.timezone)
-        created_at = now.strftime('%Y-%m-%d %H:%M:%S')
-        date = now.strftime('%Y-%m-%d')
+        date, created_at = self._now_parts()
         
         # 获取当天数据库路径
         db_path = self._get_db_path(date)
         
-        with sqlite3.connect(db_path) as conn:
-            cursor = conn.cursor()
-            
-            for keyword, count in keyword_stats.items():
-                cursor.execute('''
-                    INSERT INTO keyword_stats (keyword, count, date, created_at)
-                    VALUES (?, ?, ?, ?)
-                ''', (keyword, count, date, created_at))
+        with self._get_conn(db_path) as conn:
+            conn.executemany('''
+                INSERT INTO keyword_stats (keyword, count, date, created_at)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT(keyword, date) DO UPDATE SET count = count + excluded.count
+            ''', [(keyword, count, date, created_at) for keyword, count in keyword_stats.items()])
             
             conn.commit()
 
@@ -460,104 +664,120 @@ class NewsStorage:
         Returns:
             新闻列表
         """
-        today = datetime.now(self.timezone).strftime('%Y-%m-%d')
+        now = datetime.now(self.timezone)
+        today = now.strftime('%Y-%m-%d')
         db_path = self._get_db_path(today)
         
         # 如果数据库不存在，返回空列表
         if not db_path.exists():
             return []
         
-        with sqlite3.connect(db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        with self._get_conn(db_path) as conn:
+            # 查询显式列出字段，按 _NEWS_COLS 直接组装字典，无需 sqlite3.Row
             cursor = conn.cursor()
+            attached = False
             
-            if mode == 'current':
-                # 获取最新一批爬取的新闻
-                cursor.execute('''
-                    SELECT * FROM news 
-                    WHERE date = ? 
-                    AND crawl_time = (
-                        SELECT MAX(crawl_time) FROM news WHERE date = ?
-                    )
-                    ORDER BY platform_id, rank
-                ''', (today, today))
-            elif mode == 'incremental':
-                # 增量模式：对比今天已保存的所有新闻（最新一批之前的），返回新增的新闻
-                # 获取最新一批的爬取时间
-                cursor.execute('''
-                    SELECT MAX(crawl_time) as latest_time FROM news WHERE date = ?
-                ''', (today,))
-                result = cursor.fetchone()
-                latest_time = result['latest_time'] if result else None
-                
-                if not latest_time:
-                    return []
-                
-                # 获取今天这批之前的所有标题（不包括最新一批）
-                cursor.execute('''
-                    SELECT DISTINCT title FROM news 
-                    WHERE date = ? AND crawl_time < ?
-                ''', (today, latest_time))
-                existing_titles = {row['title'] for row in cursor.fetchall()}
-                
-                # 也检查昨天的数据库
-                yesterday = (datetime.now(self.timezone) - timedelta(days=1)).strftime('%Y-%m-%d')
-                yesterday_db = self._get_db_path(yesterday)
-                if yesterday_db.exists():
-                    with sqlite3.connect(yesterday_db) as yesterday_conn:
-                        yesterday_conn.row_factory = sqlite3.Row
-                        yesterday_cursor = yesterday_conn.cursor()
-                        yesterday_cursor.execute('SELECT DISTINCT title FROM news')
-                        existing_titles.update({row['title'] for row in yesterday_cursor.fetchall()})
-                
-                # 获取最新一批的新闻
-                cursor.execute('''
-                    SELECT * FROM news 
-                    WHERE date = ? AND crawl_time = ?
-                    ORDER BY platform_id, rank
-                ''', (today, latest_time))
-                latest_news = [dict(row) for row in cursor.fetchall()]
+            try:
+                if mode == 'current':
+                    # 获取最新一批爬取的新闻
+                    # 最新爬取时间只计算一次（走 date, crawl_time 索引）
+                    cursor.execute(f'''
+                        WITH latest AS (
+                            SELECT MAX(crawl_time) AS crawl_time FROM news WHERE date = ?
+                        )
+                        SELECT {_NEWS_SELECT} FROM news n, latest
+                        WHERE n.date = ? AND n.crawl_time = latest.crawl_time
+                        ORDER BY n.platform_id, n.rank
+                    ''', (today, today))
+                elif mode == 'incremental':
+                    # 增量模式：对比今天已保存的所有新闻（最新一批之前的）以及昨天的新闻，返回新增的新闻
+                    # 昨天的数据库通过 ATTACH 挂到同一连接上，在一条查询中完成过滤
+                    yesterday = (now - timedelta(days=1)).strftime('%Y-%m-%d')
+                    yesterday_db = self._get_db_path(yesterday)
+                    
+                    yesterday_filter = ''
+                    if yesterday_db.exists():
+                        conn.execute("ATTACH DATABASE ? AS yday", (str(yesterday_db),))
+                        attached = True
+                        yesterday_filter = '''
+                        AND NOT EXISTS (
+                            SELECT 1 FROM yday.news y
+                            WHERE y.date = :yesterday AND y.title = n.title
+                        )'''
+                    
+                    cursor.execute(f'''
+                        WITH latest AS (
+                            SELECT MAX(crawl_time) AS crawl_time FROM main.news WHERE date = :today
+                        )
+                        SELECT {_NEWS_SELECT} FROM main.news n, latest
+                        WHERE n.date = :today AND n.crawl_time = latest.crawl_time
+                        AND NOT EXISTS (
+                            -- 必须固定走 (date, title) 索引：规划器默认会选 (date, crawl_time)，
+                            -- 导致最新一批的每一行都要范围扫描今天更早的所有行
+                            SELECT 1 FROM main.news p INDEXED BY idx_news_title_date
+                            WHERE p.date = :today AND p.title = n.title AND p.crawl_time < latest.crawl_time
+                        ){yesterday_filter}
+                        ORDER BY n.platform_id, n.rank
+                    ''', {'today': today, 'yesterday': yesterday})
+                else:  # daily
+                    # 获取全天的新闻
+                    cursor.execute(f'''
+                        SELECT {_NEWS_SELECT} FROM news n
+                        WHERE n.date = ?
+                        ORDER BY n.created_at DESC, n.platform_id, n.rank
+                    ''', (today,))
                 
-                # 过滤出新增的新闻（标题不在之前的记录中）
-                incremental_news = [
-                    news for news in latest_news 
-                    if news['title'] not in existing_titles
-                ]
-                return incremental_news
-            else:  # daily
-                # 获取全天的新闻
-                cursor.execute('''
-                    SELECT * FROM news 
-                    WHERE date = ?
-                    ORDER BY created_at DESC, platform_id, rank
-                ''', (today,))
-            
-            rows = cursor.fetchall()
-            return [dict(row) for row in rows]
+                # 分批取回并直接转换，不再先整体 fetchall 一份
+                return list(_iter_rows(cursor))
+            finally:
+                if attached:
+                    conn.execute("DETACH DATABASE yday")
 
-    def _cleanup_old_data(self):
-        """清理过期数据（删除旧的数据库文件）"""
+    def _scan_db_files(self) -> List[Tuple[os.DirEntry, int]]:
+        """
+        扫描数据目录中的分片数据库文件
+        
+        Returns:
+            (目录项, 文件日期) 列表，日期为 YYYYMMDD 形式的整数；跳过文件名格式不正确的文件
+        """
+        db_files = []
+        with os.scandir(self.data_dir) as entries:
+            for entry in entries:
+                name = entry.name  # news_20260206.db
+                if (len(name) == 16 and name.startswith('news_') and name.endswith('.db')
+                        and name[5:13].isdigit()):
+                    db_files.append((entry, int(name[5:13])))
+        return db_files
+    
+    def _cleanup_old_data(self, now: Optional[datetime] = None):
+        """
+        清理过期数据（删除旧的数据库文件）
+        
+        Args:
+            now: 当前时间，默认重新获取；调用方已取过时间时直接传入
+        """
         if self.retention_days <= 0:
             return
         
-        cutoff_date = datetime.now(self.timezone) - timedelta(days=self.retention_days)
+        if now is None:
+            now = datetime.now(self.timezone)
+        cutoff_date = now - timedelta(days=self.retention_days)
+        cutoff = int(cutoff_date.strftime('%Y%m%d'))
         
         # 遍历数据目录中的所有数据库文件
         deleted_count = 0
-        for db_file in self.data_dir.glob('news_*.db'):
-            # 提取日期
-            date_str = db_file.stem.replace('news_', '')  # 20260206
-            try:
-                file_date = datetime.strptime(date_str, '%Y%m%d')
-                
-                # 如果文件过期，删除
-                if file_date.date() < cutoff_date.date():
-                    db_file.unlink()
-                    deleted_count += 1
-                    print(f"  ✓ 已删除过期数据库: {db_file.name}")
-            except ValueError:
-                # 跳过格式不正确的文件
-                continue
+        for entry, file_date in self._scan_db_files():
+            # 如果文件过期，删除（YYYYMMDD 整数可直接比较先后）
+            if file_date < cutoff:
+                db_file = Path(entry.path)
+                self._close_conn(db_file)
+                self._initialized.discard(db_file)
+                db_file.unlink()
+                # 一并删除 WAL 模式的附属文件
+                for suffix in ('-wal', '-shm'):
+                    Path(f'{db_file}{suffix}').unlink(missing_ok=True)
+                deleted_count += 1
+                print(f"  ✓ 已删除过期数据库: {entry.name}")
         
         if deleted_count > 0:
             print(f"✓ 清理完成，删除了 {deleted_count} 个过期数据库文件")
@@ -571,33 +791,47 @@ class NewsStorage:
         """
         total_news = 0
         platforms = set()
-        db_files = list(self.data_dir.glob('news_*.db'))
+        entries = [entry for entry, _ in self._scan_db_files()]
+        db_files = [Path(entry.path) for entry in entries]
         
         # 获取今天的日期
-        today = datetime.now(self.timezone).strftime('%Y-%m-%d')
+        today, _ = self._now_parts()
         today_news = 0
         
-        # 遍历所有数据库文件
-        for db_file in db_files:
-            with sqlite3.connect(db_file) as conn:
-                cursor = conn.cursor()
-                
-                # 统计新闻数
-                cursor.execute("SELECT COUNT(*) FROM news")
-                count = cursor.fetchone()[0]
-                total_news += count
-                
-                # 统计今日新闻数
-                cursor.execute("SELECT COUNT(*) FROM news WHERE date = ?", (today,))
-                today_count = cursor.fetchone()[0]
-                today_news += today_count
-                
-                # 统计平台数
-                cursor.execute("SELECT DISTINCT platform_id FROM news")
-                platforms.update([row[0] for row in cursor.fetchall()])
+        # 分批把数据库 ATTACH 到内存库上，每批用一条 UNION ALL 查询完成统计
+        with closing(sqlite3.connect(':memory:')) as conn:
+            for start in range(0, len(db_files), _ATTACH_BATCH):
+                attached = 0
+                try:
+                    for db_file in db_files[start:start + _ATTACH_BATCH]:
+                        conn.execute(f"ATTACH DATABASE ? AS d{attached}", (str(db_file),))
+                        attached += 1
+                    
+                    # 统计新闻数
+                    counts = ' UNION ALL '.join(
+                        f"SELECT COUNT(*) AS c FROM d{i}.news" for i in range(attached)
+                    )
+                    total_news += conn.execute(f"SELECT SUM(c) FROM ({counts})").fetchone()[0]
+                    
+                    # 统计平台数（走 platform_id 开头的索引）
+                    platform_ids = ' UNION '.join(
+                        f"SELECT platform_id FROM d{i}.news" for i in range(attached)
+                    )
+                    platforms.update(row[0] for row in conn.execute(platform_ids))
+                finally:
+                    for i in range(attached):
+                        conn.execute(f"DETACH DATABASE d{i}")
+        
+        # 今日新闻只会写入今天的分片，只需查询这一个文件
+        today_db = self._get_db_path(today)
+        if today_db in db_files:
+            cursor = self._get_conn(today_db).execute(
+                "SELECT COUNT(*) FROM news WHERE date = ?", (today,)
+            )
+            today_news = cursor.fetchone()[0]
         
         # 计算总大小
-        total_size = sum(f.stat().st_size for f in db_files) / (1024 * 1024)  # MB
+        total_size = sum(entry.stat().st_size for entry in entries) / (1024 * 1024)  # MB
         
         return {
             'total_news': total_news,
@@ -3,7 +3,9 @@
 标题主题分类器（与 hotnews 规则保持一致）
 """
 
-from typing import Dict, Tuple
+from typing import Dict, Optional, Tuple
+
+import ahocorasick
 
 
 DEFAULT_TOPICS = {
@@ -53,8 +55,19 @@ DEFAULT_TOPICS = {
 }
 
 
-def classify_title(title: str, topics_conf: Dict, default_topic: str = "other") -> Tuple[str, float, str]:
-    text = (title or "").lower()
+# 预处理后的主题规则：(全部关键词的自动机, ((主题名, 小写包含词, 小写排除词), ...))，AI 主题排在最前
+CompiledTopics = Tuple[Optional[ahocorasick.Automaton], Tuple[Tuple[str, Tuple[str, ...], Tuple[str, ...]], ...]]
+
+
+def compile_topics(topics_conf: Dict) -> CompiledTopics:
+    """将主题配置预处理为小写关键词元组和 Aho-Corasick 自动机，供批量分类时复用
+
+    Args:
+        topics_conf: 主题配置（{topics: {...}} 或直接为 {ai: ..., market: ...}），为空时使用默认规则
+
+    Returns:
+        预处理后的主题规则
+    """
     if topics_conf and topics_conf.get("topics"):
         conf = topics_conf
     elif topics_conf:
@@ -64,32 +77,76 @@ def classify_title(title: str, topics_conf: Dict, default_topic: str = "other")
         conf = DEFAULT_TOPICS
     topics = conf.get("topics", {})
 
-    # AI 最高优先级：一旦命中直接返回
-    ai_rule = topics.get("ai", {})
-    ai_include = [k.lower() for k in ai_rule.get("include", []) if k]
-    ai_exclude = [k.lower() for k in ai_rule.get("exclude", []) if k]
-    if not any(x in text for x in ai_exclude):
-        ai_matched = [k for k in ai_include if k in text]
-        if ai_matched:
-            ai_score = min(1.0, 0.35 + 0.15 * len(ai_matched))
-            return "ai", ai_score, f"matched:{','.join(ai_matched[:4])}"
-
-    best = ("unknown", 0.0, "no_match")
+    compiled = []
     for topic, rule in topics.items():
-        if topic == "ai":
-            continue
-        include = [k.lower() for k in rule.get("include", []) if k]
-        exclude = [k.lower() for k in rule.get("exclude", []) if k]
+        include = tuple(k.lower() for k in rule.get("include", []) if k)
+        exclude = tuple(k.lower() for k in rule.get("exclude", []) if k)
+        compiled.append((topic, include, exclude))
+    # AI 最高优先级，放在最前面先判断
+    compiled.sort(key=lambda item: item[0] != "ai")
+
+    # 所有主题的包含词、排除词放进同一个自动机，一次扫描找出标题中出现的全部关键词
+    keywords = {k for _, include, exclude in compiled for k in include + exclude}
+    automaton = None
+    if keywords:
+        automaton = ahocorasick.Automaton()
+        for kw in keywords:
+            automaton.add_word(kw, kw)
+        automaton.make_automaton()
+    return automaton, tuple(compiled)
+
 
-        if any(x in text for x in exclude):
+def classify_title_compiled(title: str, compiled: CompiledTopics, default_topic: str = "other") -> Tuple[str, float, str]:
+    """使用预处理后的主题规则对标题分类
+
+    Args:
+        title: 新闻标题
+        compiled: compile_topics 的返回值
+        default_topic: 未命中任何主题时使用的主题
+
+    Returns:
+        (主题, 置信度, 命中原因)
+    """
+    automaton, rules = compiled
+    text = (title or "").lower()
+
+    # 标题中出现过的关键词（自动机会报告所有重叠命中，与逐个子串判断等价）
+    found = {kw for _, kw in automaton.iter(text)} if automaton is not None else set()
+    if not found:
+        return default_topic, 0.05, "fallback_default"
+
+    best = ("unknown", 0.0, "no_match")
+    for topic, include, exclude in rules:
+        if any(x in found for x in exclude):
             continue
 
-        matched = [k for k in include if k in text]
+        matched = [k for k in include if k in found]
         if matched:
             score = min(1.0, 0.35 + 0.15 * len(matched))
+            # AI 最高优先级：一旦命中直接返回
+            if topic == "ai":
+                return "ai", score, f"matched:{','.join(matched[:4])}"
             if score > best[1]:
                 best = (topic, score, f"matched:{','.join(matched[:4])}")
 
     if best[0] == "unknown":
         return default_topic, 0.05, "fallback_default"
     return best
+
+
+# classify_title 的预处理缓存：{id(配置): (配置, 预处理结果)}，同时持有配置对象，避免 id 被复用后误命中
+_compiled_cache: Dict[int, Tuple[Dict, CompiledTopics]] = {}
+
+
+def classify_title(title: str, topics_conf: Dict, default_topic: str = "other") -> Tuple[str, float, str]:
+    """按主题配置对标题分类（同一配置对象只预处理一次，配置需视为只读）"""
+    if not topics_conf:
+        # 空配置都使用默认规则，共用同一份缓存
+        topics_conf = DEFAULT_TOPICS
+    cached = _compiled_cache.get(id(topics_conf))
+    if cached is None or cached[0] is not topics_conf:
+        if len(_compiled_cache) >= 8:
+            _compiled_cache.clear()
+        cached = (topics_conf, compile_topics(topics_conf))
+        _compiled_cache[id(topics_conf)] = cached
+    return classify_title_compiled(title, cached[1], default_topic)